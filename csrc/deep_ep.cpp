@@ -7,7 +7,9 @@
 #include <torch/python.h>
 
 #include <chrono>
+#include <functional>
 #include <memory>
+#include <numeric>
 
 #include "kernels/api.cuh"
 #include "kernels/configs.cuh"
@@ -264,12 +266,22 @@ pybind11::bytearray Buffer::get_local_nvshmem_unique_id() const {
 #endif
 }
 
-torch::Tensor Buffer::get_local_buffer_tensor(const pybind11::object& dtype, int64_t offset, bool use_rdma_buffer) const {
+torch::Tensor Buffer::get_local_buffer_tensor(const pybind11::object& dtype,
+                                              int64_t offset,
+                                              bool use_rdma_buffer,
+                                              const std::optional<std::vector<int64_t>>& shape) const {
     torch::ScalarType casted_dtype = torch::python::detail::py_object_to_dtype(dtype);
     auto element_bytes = static_cast<int64_t>(elementSize(casted_dtype));
     auto base_ptr = static_cast<uint8_t*>(use_rdma_buffer ? rdma_buffer_ptr : buffer_ptrs[nvl_rank]) + offset;
     auto num_bytes = use_rdma_buffer ? num_rdma_bytes : num_nvl_bytes;
-    return torch::from_blob(base_ptr, num_bytes / element_bytes, torch::TensorOptions().dtype(casted_dtype).device(at::kCUDA));
+    auto options = torch::TensorOptions().dtype(casted_dtype).device(at::kCUDA);
+    if (not shape.has_value())
+        return torch::from_blob(base_ptr, num_bytes / element_bytes, options);
+
+    // Create the sliced view directly, instead of slicing and viewing in Python
+    auto num_elements = std::accumulate(shape->begin(), shape->end(), static_cast<int64_t>(1), std::multiplies<int64_t>());
+    EP_HOST_ASSERT(num_elements <= num_bytes / element_bytes);
+    return torch::from_blob(base_ptr, shape.value(), options);
 }
 
 torch::Stream Buffer::get_comm_stream() const {
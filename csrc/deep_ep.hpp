@@ -140,7 +140,10 @@ public:
 
     pybind11::bytearray get_local_nvshmem_unique_id() const;
 
-    torch::Tensor get_local_buffer_tensor(const pybind11::object& dtype, int64_t offset, bool use_rdma_buffer) const;
+    torch::Tensor get_local_buffer_tensor(const pybind11::object& dtype,
+                                          int64_t offset,
+                                          bool use_rdma_buffer,
+                                          const std::optional<std::vector<int64_t>>& shape = std::nullopt) const;
 
     torch::Stream get_comm_stream() const;
 
@@ -1,3 +1,4 @@
+import functools
 import os
 import torch
 import torch.distributed as dist
@@ -92,17 +93,10 @@ class Buffer:
         self.runtime = deep_ep_cpp.Buffer(self.rank, self.group_size, num_nvl_bytes, num_rdma_bytes, low_latency_mode, explicitly_destroy,
                                           enable_shrink, use_fabric)
 
-        # Synchronize device IDs
-        local_device_id = self.runtime.get_local_device_id()
-        device_ids = all_gather_object(local_device_id)
-
-        # Synchronize IPC handles
-        local_ipc_handle = self.runtime.get_local_ipc_handle()
-        ipc_handles = all_gather_object(local_ipc_handle)
-
-        # Synchronize NVSHMEM unique IDs
+        # Prepare NVSHMEM unique IDs
         root_unique_id = None
-        if self.runtime.get_num_rdma_ranks() > 1 or low_latency_mode:
+        use_nvshmem = self.runtime.get_num_rdma_ranks() > 1 or low_latency_mode
+        if use_nvshmem:
             # Enable IBGDA
             assert num_qps_per_rank > 0
             os.environ['NVSHMEM_DISABLE_P2P'] = '0' if allow_nvlink_for_low_latency_mode else '1'
@@ -125,10 +119,16 @@ class Buffer:
                 # Disable multi-node NVLink detection
                 os.environ['NVSHMEM_DISABLE_MNNVL'] = '1'
 
-            # Synchronize using the root ID
+            # Only the root ranks hold a unique ID
             if (low_latency_mode and self.rank == 0) or (not low_latency_mode and self.runtime.get_rdma_rank() == 0):
                 root_unique_id = self.runtime.get_local_nvshmem_unique_id()
-            nvshmem_unique_ids = all_gather_object(root_unique_id)
+
+        # Synchronize device IDs, IPC handles and NVSHMEM unique IDs with a single collective
+        # NOTES: IPC handles are only consumed with NVLink buffers, skip the payload otherwise
+        local_ipc_handle = self.runtime.get_local_ipc_handle() if num_nvl_bytes > 0 else None
+        local_info = (self.runtime.get_local_device_id(), local_ipc_handle, root_unique_id)
+        device_ids, ipc_handles, nvshmem_unique_ids = zip(*all_gather_object(local_info))
+        if use_nvshmem:
             root_unique_id = nvshmem_unique_ids[0 if low_latency_mode else self.runtime.get_root_rdma_rank(True)]
 
         # Make CPP runtime available
@@ -212,12 +212,7 @@ class Buffer:
             offset: the offset of the beginning element.
             use_rdma_buffer: whether to return the RDMA buffer.
         """
-        tensor = self.runtime.get_local_buffer_tensor(dtype, offset, use_rdma_buffer)
-        if size is None:
-            return tensor
-
-        assert tensor.numel() >= size.numel()
-        return tensor[:size.numel()].view(size)
+        return self.runtime.get_local_buffer_tensor(dtype, offset, use_rdma_buffer, size)
 
     @staticmethod
     def _unpack_bias(bias: Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]):
@@ -240,21 +235,26 @@ class Buffer:
         Returns:
             config: the recommended config.
         """
+        return Buffer._get_dispatch_config(num_ranks, Buffer.num_sms)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_dispatch_config(num_ranks: int, num_sms: int) -> Config:
+        # NOTES: called on every dispatch/combine without an explicit config, so the results are cached by SM count
         # TODO: automatically tune
         config_map = {
-            2: Config(Buffer.num_sms, 24, 256, 6, 128),
-            4: Config(Buffer.num_sms, 6, 256, 6, 128),
-            8: Config(Buffer.num_sms, 6, 256, 6, 128),
-            16: Config(Buffer.num_sms, 36, 288, 20, 128),
-            24: Config(Buffer.num_sms, 32, 288, 8, 128),
-            32: Config(Buffer.num_sms, 32, 288, 8, 128),
-            48: Config(Buffer.num_sms, 32, 288, 8, 128),
-            64: Config(Buffer.num_sms, 32, 288, 8, 128),
-            96: Config(Buffer.num_sms, 20, 480, 12, 128),
-            128: Config(Buffer.num_sms, 20, 560, 12, 128),
-            144: Config(Buffer.num_sms, 32, 720, 12, 128),
-            160: Config(Buffer.num_sms, 28, 720, 12, 128),
+            2: Config(num_sms, 24, 256, 6, 128),
+            4: Config(num_sms, 6, 256, 6, 128),
+            8: Config(num_sms, 6, 256, 6, 128),
+            16: Config(num_sms, 36, 288, 20, 128),
+            24: Config(num_sms, 32, 288, 8, 128),
+            32: Config(num_sms, 32, 288, 8, 128),
+            48: Config(num_sms, 32, 288, 8, 128),
+            64: Config(num_sms, 32, 288, 8, 128),
+            96: Config(num_sms, 20, 480, 12, 128),
+            128: Config(num_sms, 20, 560, 12, 128),
+            144: Config(num_sms, 32, 720, 12, 128),
+            160: Config(num_sms, 28, 720, 12, 128),
         }
         assert num_ranks in config_map, f'Unsupported number of EP ranks: {num_ranks}'
         return config_map[num_ranks]
@@ -270,21 +270,25 @@ class Buffer:
         Returns:
             config: the recommended config.
         """
+        return Buffer._get_combine_config(num_ranks, Buffer.num_sms)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_combine_config(num_ranks: int, num_sms: int) -> Config:
         # TODO: automatically tune
         config_map = {
-            2: Config(Buffer.num_sms, 10, 256, 6, 128),
-            4: Config(Buffer.num_sms, 9, 256, 6, 128),
-            8: Config(Buffer.num_sms, 4, 256, 6, 128),
-            16: Config(Buffer.num_sms, 4, 288, 12, 128),
-            24: Config(Buffer.num_sms, 1, 288, 8, 128),
-            32: Config(Buffer.num_sms, 1, 288, 8, 128),
-            48: Config(Buffer.num_sms, 1, 288, 8, 128),
-            64: Config(Buffer.num_sms, 1, 288, 8, 128),
-            96: Config(Buffer.num_sms, 1, 480, 8, 128),
-            128: Config(Buffer.num_sms, 1, 560, 8, 128),
-            144: Config(Buffer.num_sms, 2, 720, 8, 128),
-            160: Config(Buffer.num_sms, 2, 720, 8, 128),
+            2: Config(num_sms, 10, 256, 6, 128),
+            4: Config(num_sms, 9, 256, 6, 128),
+            8: Config(num_sms, 4, 256, 6, 128),
+            16: Config(num_sms, 4, 288, 12, 128),
+            24: Config(num_sms, 1, 288, 8, 128),
+            32: Config(num_sms, 1, 288, 8, 128),
+            48: Config(num_sms, 1, 288, 8, 128),
+            64: Config(num_sms, 1, 288, 8, 128),
+            96: Config(num_sms, 1, 480, 8, 128),
+            128: Config(num_sms, 1, 560, 8, 128),
+            144: Config(num_sms, 2, 720, 8, 128),
+            160: Config(num_sms, 2, 720, 8, 128),
         }
         assert num_ranks in config_map, f'Unsupported number of EP ranks: {num_ranks}'
         return config_map[num_ranks]
@@ -314,9 +318,10 @@ class Buffer:
             event: the event after executing the kernel (valid only if `async_finish` is set).
         """
         num_tokens_per_rank, num_tokens_per_rdma_rank, num_tokens_per_expert, is_token_in_rank, event = \
-            self.runtime.get_dispatch_layout(topk_idx, num_experts, getattr(previous_event, 'event', None),
+            self.runtime.get_dispatch_layout(topk_idx, num_experts, previous_event.event if previous_event is not None else None,
                                              async_finish, allocate_on_comm_stream)
-        return num_tokens_per_rank, num_tokens_per_rdma_rank, num_tokens_per_expert, is_token_in_rank, EventOverlap(event)
+        return num_tokens_per_rank, num_tokens_per_rdma_rank, num_tokens_per_expert, is_token_in_rank, \
+            EventOverlap.wrap(event)
 
     # noinspection PyTypeChecker
     def dispatch(self, x: Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]],
@@ -370,7 +375,7 @@ class Buffer:
             event: the event after executing the kernel (valid only if `async_finish` is set).
         """
         # Default config
-        config = self.get_dispatch_config(self.group_size) if config is None else config
+        config = Buffer._get_dispatch_config(self.group_size, Buffer.num_sms) if config is None else config
 
         # Internode
         if self.runtime.get_num_rdma_ranks() > 1:
@@ -380,26 +385,26 @@ class Buffer:
 
         # Launch the kernel with cached or non-cached mode
         x, x_scales = x if isinstance(x, tuple) else (x, None)
+        previous_event_handle = previous_event.event if previous_event is not None else None
         if handle is not None:
             assert topk_idx is None and topk_weights is None
             rank_prefix_matrix, channel_prefix_matrix, recv_channel_prefix_matrix, recv_src_idx, is_token_in_rank, send_head = handle
             num_recv_tokens = recv_src_idx.size(0)
             recv_x, recv_x_scales, _, _, _, _, _, _, _, _, event = self.runtime.intranode_dispatch(
                 x, x_scales, None, None, None, is_token_in_rank, None, num_recv_tokens, rank_prefix_matrix, channel_prefix_matrix,
-                expert_alignment, num_worst_tokens, config, getattr(previous_event, 'event', None), async_finish, allocate_on_comm_stream)
-            return (recv_x, recv_x_scales) if x_scales is not None else recv_x, None, None, None, None, EventOverlap(event)
+                expert_alignment, num_worst_tokens, config, previous_event_handle, async_finish, allocate_on_comm_stream)
+            return (recv_x, recv_x_scales) if x_scales is not None else recv_x, None, None, None, None, \
+                EventOverlap.wrap(event)
         else:
             assert num_tokens_per_rank is not None and is_token_in_rank is not None and num_tokens_per_expert is not None
             recv_x, recv_x_scales, recv_topk_idx, recv_topk_weights, num_recv_tokens_per_expert_list, rank_prefix_matrix, channel_prefix_matrix, recv_channel_prefix_matrix, recv_src_idx, send_head, event = \
                 self.runtime.intranode_dispatch(x, x_scales, topk_idx, topk_weights,
                                                 num_tokens_per_rank, is_token_in_rank, num_tokens_per_expert, 0, None, None,
                                                 expert_alignment, num_worst_tokens, config,
-                                                getattr(previous_event, 'event', None), async_finish, allocate_on_comm_stream)
+                                                previous_event_handle, async_finish, allocate_on_comm_stream)
             handle = (rank_prefix_matrix, channel_prefix_matrix, recv_channel_prefix_matrix, recv_src_idx, is_token_in_rank, send_head)
-            return (
-                recv_x, recv_x_scales
-            ) if x_scales is not None else recv_x, recv_topk_idx, recv_topk_weights, num_recv_tokens_per_expert_list, handle, EventOverlap(
-                event)
+            return (recv_x, recv_x_scales) if x_scales is not None else recv_x, recv_topk_idx, recv_topk_weights, \
+                num_recv_tokens_per_expert_list, handle, EventOverlap.wrap(event)
 
     # noinspection PyTypeChecker
     def combine(self, x: torch.Tensor, handle: Tuple,
@@ -432,7 +437,7 @@ class Buffer:
             event: the event after executing the kernel (valid only if `async_finish` is set).
         """
         # Default config
-        config = self.get_combine_config(self.group_size) if config is None else config
+        config = Buffer._get_combine_config(self.group_size, Buffer.num_sms) if config is None else config
 
         # Internode
         if self.runtime.get_num_rdma_ranks() > 1:
@@ -441,13 +446,13 @@ class Buffer:
         # NOTES: the second `_` is for the sending side, so we should use the third one
         rank_prefix_matrix, _, channel_prefix_matrix, src_idx, is_recv_token_in_rank, send_head = handle
         bias_0, bias_1 = Buffer._unpack_bias(bias)
+        previous_event_handle = previous_event.event if previous_event is not None else None
 
         # Launch the kernel
         recv_x, recv_topk_weights, event = self.runtime.intranode_combine(x, topk_weights, bias_0, bias_1, src_idx, rank_prefix_matrix,
-                                                                          channel_prefix_matrix, send_head, config,
-                                                                          getattr(previous_event, 'event',
-                                                                                  None), async_finish, allocate_on_comm_stream)
-        return recv_x, recv_topk_weights, EventOverlap(event)
+                                                                          channel_prefix_matrix, send_head, config, previous_event_handle,
+                                                                          async_finish, allocate_on_comm_stream)
+        return recv_x, recv_topk_weights, EventOverlap.wrap(event)
 
     # noinspection PyTypeChecker
     def internode_dispatch(self, x: Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]],
@@ -468,6 +473,7 @@ class Buffer:
 
         # Launch the kernel with cached or non-cached mode
         x, x_scales = x if isinstance(x, tuple) else (x, None)
+        previous_event_handle = previous_event.event if previous_event is not None else None
         if handle is not None:
             assert topk_idx is None and topk_weights is None
             is_token_in_rank, \
@@ -479,8 +485,9 @@ class Buffer:
             recv_x, recv_x_scales, _, _, _, _, _, _, _, _, _, _, _, _, event = self.runtime.internode_dispatch(
                 x, x_scales, topk_idx, topk_weights, None, None, is_token_in_rank, None, num_recv_tokens, num_rdma_recv_tokens,
                 rdma_channel_prefix_matrix, recv_rdma_rank_prefix_sum, gbl_channel_prefix_matrix, recv_gbl_rank_prefix_sum,
-                expert_alignment, num_worst_tokens, config, getattr(previous_event, 'event', None), async_finish, allocate_on_comm_stream)
-            return (recv_x, recv_x_scales) if x_scales is not None else recv_x, None, None, None, None, EventOverlap(event)
+                expert_alignment, num_worst_tokens, config, previous_event_handle, async_finish, allocate_on_comm_stream)
+            return (recv_x, recv_x_scales) if x_scales is not None else recv_x, None, None, None, None, \
+                EventOverlap.wrap(event)
         else:
             assert num_tokens_per_rank is not None and is_token_in_rank is not None and num_tokens_per_expert is not None
             recv_x, recv_x_scales, recv_topk_idx, recv_topk_weights, num_recv_tokens_per_expert_list, \
@@ -491,14 +498,12 @@ class Buffer:
                 x, x_scales, topk_idx, topk_weights,
                 num_tokens_per_rank, num_tokens_per_rdma_rank, is_token_in_rank, num_tokens_per_expert,
                 0, 0, None, None, None, None,
-                expert_alignment, num_worst_tokens, config, getattr(previous_event, 'event', None), async_finish, allocate_on_comm_stream)
+                expert_alignment, num_worst_tokens, config, previous_event_handle, async_finish, allocate_on_comm_stream)
             handle = (is_token_in_rank, rdma_channel_prefix_matrix, gbl_channel_prefix_matrix, recv_rdma_channel_prefix_matrix,
                       recv_rdma_rank_prefix_sum, recv_gbl_channel_prefix_matrix, recv_gbl_rank_prefix_sum, recv_src_meta, send_rdma_head,
                       send_nvl_head)
-            return (
-                recv_x, recv_x_scales
-            ) if x_scales is not None else recv_x, recv_topk_idx, recv_topk_weights, num_recv_tokens_per_expert_list, handle, EventOverlap(
-                event)
+            return (recv_x, recv_x_scales) if x_scales is not None else recv_x, recv_topk_idx, recv_topk_weights, \
+                num_recv_tokens_per_expert_list, handle, EventOverlap.wrap(event)
 
     # noinspection PyTypeChecker
     def internode_combine(self, x: torch.Tensor, handle: Union[tuple, list],
@@ -520,15 +525,13 @@ class Buffer:
             rdma_channel_prefix_matrix, rdma_rank_prefix_sum, gbl_channel_prefix_matrix, gbl_rank_prefix_sum, \
             src_meta, send_rdma_head, send_nvl_head = handle
         bias_0, bias_1 = Buffer._unpack_bias(bias)
+        previous_event_handle = previous_event.event if previous_event is not None else None
 
         # Launch the kernel
-        combined_x, combined_topk_weights, event = self.runtime.internode_combine(x, topk_weights, bias_0, bias_1, src_meta,
-                                                                                  is_combined_token_in_rank, rdma_channel_prefix_matrix,
-                                                                                  rdma_rank_prefix_sum, gbl_channel_prefix_matrix,
-                                                                                  send_rdma_head, send_nvl_head, config,
-                                                                                  getattr(previous_event, 'event',
-                                                                                          None), async_finish, allocate_on_comm_stream)
-        return combined_x, combined_topk_weights, EventOverlap(event)
+        combined_x, combined_topk_weights, event = self.runtime.internode_combine(
+            x, topk_weights, bias_0, bias_1, src_meta, is_combined_token_in_rank, rdma_channel_prefix_matrix, rdma_rank_prefix_sum,
+            gbl_channel_prefix_matrix, send_rdma_head, send_nvl_head, config, previous_event_handle, async_finish, allocate_on_comm_stream)
+        return combined_x, combined_topk_weights, EventOverlap.wrap(event)
 
     def clean_low_latency_buffer(self, num_max_dispatch_tokens_per_rank: int, hidden: int, num_experts: int) -> None:
         """
@@ -608,10 +611,10 @@ class Buffer:
                                               use_fp8, round_scale, use_ue8m0,
                                               async_finish, return_recv_hook)
         handle = (packed_recv_src_info, packed_recv_layout_range, num_max_dispatch_tokens_per_rank, x.size(1), num_experts)
-        tensors_to_record = (x, topk_idx, packed_recv_x, packed_recv_x_scales, packed_recv_count, packed_recv_src_info,
-                             packed_recv_layout_range, cumulative_local_expert_recv_stats)
-        return (packed_recv_x, packed_recv_x_scales) if use_fp8 else packed_recv_x, packed_recv_count, handle, \
-            EventOverlap(event, tensors_to_record if async_finish else None), hook
+        # NOTES: only asynchronous calls need to hold the tensors, skip building the tuple otherwise
+        event_overlap = EventOverlap.wrap(event, (x, topk_idx, packed_recv_x, packed_recv_x_scales, packed_recv_count, packed_recv_src_info,
+                                                  packed_recv_layout_range, cumulative_local_expert_recv_stats) if async_finish else None)
+        return (packed_recv_x, packed_recv_x_scales) if use_fp8 else packed_recv_x, packed_recv_count, handle, event_overlap, hook
 
     # noinspection PyTypeChecker
     def low_latency_combine(self, x: torch.Tensor, topk_idx: torch.Tensor, topk_weights: torch.Tensor,
@@ -657,8 +660,8 @@ class Buffer:
         combined_x, event, hook = self.runtime.low_latency_combine(x, topk_idx, topk_weights, src_info, layout_range,
                                                                    combine_wait_recv_cost_stats, num_max_dispatch_tokens_per_rank,
                                                                    num_experts, use_logfmt, zero_copy, async_finish, return_recv_hook, out)
-        tensors_to_record = (x, topk_idx, topk_weights, src_info, layout_range, combined_x)
-        return combined_x, EventOverlap(event, tensors_to_record if async_finish else None), hook
+        event_overlap = EventOverlap.wrap(event, (x, topk_idx, topk_weights, src_info, layout_range, combined_x) if async_finish else None)
+        return combined_x, event_overlap, hook
 
     def low_latency_update_mask_buffer(self, rank_to_mask: int, mask: bool = False):
         """
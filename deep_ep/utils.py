@@ -1,3 +1,4 @@
+import functools
 import os
 import torch
 import torch.distributed as dist
@@ -14,6 +15,8 @@ class EventOverlap:
     Attributes:
         event: the CUDA event captured.
         extra_tensors: an easier way to simulate PyTorch tensor `record_stream`, may be useful with CUDA graph.
+
+    Synchronous calls have no event to wait, please use `EventOverlap.wrap` to get the shared read-only instance for them.
     """
 
     def __init__(self, event: Optional[EventHandle] = None, extra_tensors: Optional[Tuple[torch.Tensor]] = None) -> None:
@@ -30,6 +33,22 @@ class EventOverlap:
         # stream recording will be incompatible with CUDA graph.
         self.extra_tensors = extra_tensors
 
+    @staticmethod
+    def wrap(event: Optional[EventHandle], extra_tensors: Optional[Tuple[torch.Tensor]] = None) -> 'EventOverlap':
+        """
+        Wrap an event returned by the runtime.
+
+        Arguments:
+            event: the CUDA event captured, `None` for synchronous calls.
+            extra_tensors: an easier way to simulate PyTorch tensor `record_stream`, may be useful with CUDA graph.
+
+        Returns:
+            overlap: a new `EventOverlap`, or the shared read-only no-op instance if there is nothing to hold.
+        """
+        if event is None and extra_tensors is None:
+            return _NOOP_EVENT_OVERLAP
+        return EventOverlap(event, extra_tensors)
+
     def current_stream_wait(self) -> None:
         """
         The current stream `torch.cuda.current_stream()` waits for the event to be finished.
@@ -61,6 +80,28 @@ class EventOverlap:
             self.event.current_stream_wait()
 
 
+class _NoopEventOverlap(EventOverlap):
+    """
+    A read-only `EventOverlap` without any event, shared by all synchronous calls.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        object.__setattr__(self, 'event', None)
+        object.__setattr__(self, 'extra_tensors', None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('The shared no-op `EventOverlap` is read-only')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('The shared no-op `EventOverlap` is read-only')
+
+
+# NOTES: synchronous calls share one instance instead of allocating one per call
+_NOOP_EVENT_OVERLAP = _NoopEventOverlap()
+
+
 def check_nvlink_connections(group: dist.ProcessGroup):
     """
     Check NVLink connection between every pair of GPUs.
@@ -74,10 +115,6 @@ def check_nvlink_connections(group: dist.ProcessGroup):
     if 'PCIE' in torch.cuda.get_device_name():
         assert group.size() <= 2, 'PCIe GPUs only have pairwise NVLink connections'
 
-        # noinspection PyUnresolvedReferences
-        import pynvml
-        pynvml.nvmlInit()
-
         # noinspection PyTypeChecker
         devices = os.environ.get('CUDA_VISIBLE_DEVICES', '0,1,2,3,4,5,6,7').strip(',').split(',')
         physical_device_idx = int(devices[torch.cuda.current_device()])
@@ -86,16 +123,32 @@ def check_nvlink_connections(group: dist.ProcessGroup):
         ] * group.size()
         dist.all_gather_object(physical_device_indices, physical_device_idx, group)
 
-        # Check whether they are all connected via NVLink
-        # Reference: https://github.com/vllm-project/vllm/blob/b8e809a057765c574726a6077fd124db5077ce1f/vllm/platforms/cuda.py#L438
-        handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in physical_device_indices]
-        for i, handle in enumerate(handles):
-            for j, peer_handle in enumerate(handles):
-                if i >= j:
-                    continue
-                status = pynvml.nvmlDeviceGetP2PStatus(handle, peer_handle, pynvml.NVML_P2P_CAPS_INDEX_NVLINK)
-                assert status == pynvml.NVML_P2P_STATUS_OK,\
-                    f'GPU {physical_device_indices[i]} and GPU {physical_device_indices[j]} are not connected via NVLink'
-
-        # Close NVML
-        pynvml.nvmlShutdown()
+        _check_nvlink_p2p_status(tuple(physical_device_indices))
+
+
+@functools.lru_cache(maxsize=None)
+def _check_nvlink_p2p_status(physical_device_indices: Tuple[int, ...]) -> None:
+    """
+    Check via NVML that every pair of the given physical GPUs is connected via NVLink.
+    The result is cached, so that constructing more buffers on the same GPUs skips the NVML queries.
+
+    Arguments:
+        physical_device_indices: the physical GPU indices of all ranks in the group.
+    """
+    # noinspection PyUnresolvedReferences
+    import pynvml
+    pynvml.nvmlInit()
+
+    # Check whether they are all connected via NVLink
+    # Reference: https://github.com/vllm-project/vllm/blob/b8e809a057765c574726a6077fd124db5077ce1f/vllm/platforms/cuda.py#L438
+    handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in physical_device_indices]
+    for i, handle in enumerate(handles):
+        for j, peer_handle in enumerate(handles):
+            if i >= j:
+                continue
+            status = pynvml.nvmlDeviceGetP2PStatus(handle, peer_handle, pynvml.NVML_P2P_CAPS_INDEX_NVLINK)
+            assert status == pynvml.NVML_P2P_STATUS_OK,\
+                f'GPU {physical_device_indices[i]} and GPU {physical_device_indices[j]} are not connected via NVLink'
+
+    # Close NVML
+    pynvml.nvmlShutdown()